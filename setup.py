@@ -7,13 +7,16 @@ setup(
     description="Well-Architected Framework Friendly Enhanced Layout - Transform WAF reports into actionable insights",
     packages=find_packages(),
     install_requires=[
-        "PyPDF2>=3.0.0",
+        "pypdf>=4.0.0",
         "openpyxl>=3.1.0",
         "InquirerPy>=0.3.4",
         "boto3>=1.26.0",
         "python-pptx>=0.6.21",
         "requests>=2.25.0",
     ],
+    extras_require={
+        "fast": ["XlsxWriter>=3.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "waffel=waffel.cli:main",
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Helpers shared across WAFFEL modules."""
+
+import os
+
+# Pillar abbreviations used in question IDs, shared by the parsers and the config
+PILLAR_ABBREVIATIONS = {
+    'Operational Excellence': 'OPS',
+    'Security': 'SEC',
+    'Reliability': 'REL',
+    'Performance Efficiency': 'PERF',
+    'Cost Optimization': 'COST',
+    'Sustainability': 'SUS'
+}
+
+def truncate(text, width):
+    """Shorten text to at most width characters, ending with '...' when cut"""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+def flatten_improvement_items(pillars):
+    """List every improvement item with its pillar and question, in report order"""
+    return [
+        {
+            'pillar': pillar_name,
+            'question_id': question['question_id'],
+            'question': question['question'],
+            'risk_level': question.get('risk_level', ''),
+            'item': item_data['item'],
+            'url': item_data['url']
+        }
+        for pillar_name, questions in pillars.items()
+        for question in questions
+        for item_data in question.get('improvement_items') or ()
+    ]
+
+def cache_path(filename):
+    """Return the path of a file in the WAFFEL user cache directory"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'waffel', filename)
@@ -3,45 +3,58 @@
 import argparse
 import os
 import sys
-from InquirerPy import inquirer
+from concurrent.futures import ThreadPoolExecutor
+from ._common import truncate
 from .converter import convert_to_excel, convert_to_powerpoint
 from .factory import create_data_source
-from .data_source_api import APIDataSource
 
-def get_available_sources():
-    """Get all available sources: PDFs and WA workloads"""
-    sources = []
+def get_pdf_sources():
+    """Get PDF files in the current directory as sources"""
+    with os.scandir('.') as entries:
+        pdf_files = [e.name for e in entries if e.name.lower().endswith('.pdf') and e.is_file()]
+
+    return [{
+        'type': 'pdf',
+        'display': f"📄 {pdf}",
+        'value': pdf
+    } for pdf in pdf_files]
 
-    # Get PDF files
-    pdf_files = [f for f in os.listdir('.') if f.lower().endswith('.pdf')]
-    for pdf in pdf_files:
+def get_workload_sources():
+    """Get AWS Well-Architected workloads as sources"""
+    from .data_source_api import APIDataSource  # pylint: disable=import-outside-toplevel
+
+    sources = []
+    api = APIDataSource()
+    for w in api.iter_workloads():
+        description = truncate(w.get('Description', 'No description'), 40)
         sources.append({
-            'type': 'pdf',
-            'display': f"📄 {pdf}",
-            'value': pdf
+            'type': 'api',
+            'display': f"⌬ {w['WorkloadName']} - {description}",
+            'value': w['WorkloadId']
         })
+    return sources
 
-    # Try to get WA workloads
-    try:
-        api = APIDataSource()
-        workloads = api.get_workloads()
-        for w in workloads:
-            description = w.get('Description', 'No description')
-            if len(description) > 40:
-                description = description[:37] + "..."
-            sources.append({
-                'type': 'api',
-                'display': f"⌬ {w['WorkloadName']} - {description}",
-                'value': w['WorkloadId']
-            })
-    except Exception:  # nosec B110
-        # Silently ignore AWS access issues
-        pass
+def get_available_sources():
+    """Get all available sources: PDFs and WA workloads"""
+
+    # Scan the directory while the AWS client is created and workloads are listed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        workloads_future = executor.submit(get_workload_sources)
+        sources = get_pdf_sources()
+
+        # Try to get WA workloads
+        try:
+            sources.extend(workloads_future.result())
+        except Exception:  # nosec B110
+            # Silently ignore AWS access issues
+            pass
 
     return sources
 
 def select_source():
     """Select source from combined PDF and workload list"""
+    from InquirerPy import inquirer  # pylint: disable=import-outside-toplevel
+
     sources = get_available_sources()
 
     if not sources:
@@ -56,15 +69,15 @@ def select_source():
         print(f"Found single source: {source['display']}")
         return source
 
-    choices = [s['display'] for s in sources]
+    sources_by_display = {s['display']: s for s in sources}
 
     selection = inquirer.select(
         message="Select a source:",
-        choices=choices
+        choices=list(sources_by_display)
     ).execute()
 
     # Find the selected source
-    return next(s for s in sources if s['display'] == selection)
+    return sources_by_display[selection]
 
 def main():
     """Main CLI entry point."""
@@ -75,6 +88,7 @@ def main():
     parser.add_argument("-l", "--lens-alias", help="Well-Architected lens alias")
     parser.add_argument("--api", action="store_true", help="Force API mode (ignore PDF files)")
     parser.add_argument("--pptx", action="store_true", help="Generate PowerPoint presentation instead of Excel")
+    parser.add_argument("--skip-details", action="store_true", help="API mode: skip per-question notes and improvement plan URLs (one API call instead of one per question)")
 
     args = parser.parse_args()
 
@@ -102,7 +116,7 @@ def main():
 
     try:
         # Create data source
-        data_source = create_data_source(pdf_file, workload_id, lens_alias)
+        data_source = create_data_source(pdf_file, workload_id, lens_alias, not args.skip_details)
 
         # Get workload data
         workload_data = data_source.get_workload_data()
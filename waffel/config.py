@@ -2,6 +2,15 @@
 """Configuration settings for WAFFEL styling and formatting."""
 
 from openpyxl.styles import Font, PatternFill, Alignment
+from ._common import PILLAR_ABBREVIATIONS as _PILLAR_ABBREVIATIONS
+
+# Shared style instances; generators assign these exact objects instead of
+# building equivalent ones per cell
+_RED_FILL = PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid")
+_YELLOW_FILL = PatternFill(start_color="FFE66D", end_color="FFE66D", fill_type="solid")
+_TEAL_FILL = PatternFill(start_color="95E1D3", end_color="95E1D3", fill_type="solid")
+_GREEN_FILL = PatternFill(start_color="A8E6CF", end_color="A8E6CF", fill_type="solid")
+_GREY_FILL = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
 
 class WAFFELConfig:
     """Configuration settings for WAFFEL"""
@@ -16,14 +25,7 @@ class WAFFELConfig:
         'sustainability': 'Sustainability'
     }
 
-    PILLAR_ABBREVIATIONS = {
-        'Operational Excellence': 'OPS',
-        'Security': 'SEC',
-        'Reliability': 'REL',
-        'Performance Efficiency': 'PERF',
-        'Cost Optimization': 'COST',
-        'Sustainability': 'SUS'
-    }
+    PILLAR_ABBREVIATIONS = _PILLAR_ABBREVIATIONS
 
     # Excel styles
     HEADER_FONT = Font(bold=True, color="FFFFFF")
@@ -31,24 +33,25 @@ class WAFFELConfig:
     QUESTION_FONT = Font(bold=True)
     QUESTION_FILL = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
     CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+    PROPERTIES_ALIGNMENT = Alignment(wrap_text=False, vertical="center")
 
     # Risk colors
     RISK_COLORS = {
-        'High Risk': PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid"),
-        'Medium Risk': PatternFill(start_color="FFE66D", end_color="FFE66D", fill_type="solid"),
-        'Low Risk': PatternFill(start_color="95E1D3", end_color="95E1D3", fill_type="solid")
+        'High Risk': _RED_FILL,
+        'Medium Risk': _YELLOW_FILL,
+        'Low Risk': _TEAL_FILL
     }
 
     # Status colors
     STATUS_COLORS = {
-        '✅ Selected': PatternFill(start_color="A8E6CF", end_color="A8E6CF", fill_type="solid"),
-        '⚠️ Not Selected': PatternFill(start_color="FFE66D", end_color="FFE66D", fill_type="solid"),
-        'Not Applicable': PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
+        '✅ Selected': _GREEN_FILL,
+        '⚠️ Not Selected': _YELLOW_FILL,
+        'Not Applicable': _GREY_FILL
     }
 
     # Summary risk colors
-    HIGH_RISK_FILL = PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid")
-    MEDIUM_RISK_FILL = PatternFill(start_color="FFE66D", end_color="FFE66D", fill_type="solid")
+    HIGH_RISK_FILL = _RED_FILL
+    MEDIUM_RISK_FILL = _YELLOW_FILL
 
     # Column widths
     COLUMN_WIDTHS = {
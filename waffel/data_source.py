@@ -18,4 +18,4 @@ class DataSource(ABC):
                 'source_info': str
             }
         """
-        raise NotImplementedError("Subclasses must implement extract_data method")
+        raise NotImplementedError("Subclasses must implement get_workload_data method")
@@ -1,32 +1,62 @@
 #!/usr/bin/env python3
 """AWS Well-Architected Tool API data source implementation."""
 
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import boto3
+from botocore.config import Config
 from InquirerPy import inquirer
+from ._common import truncate
 from .data_source import DataSource
 from .config import WAFFELConfig
 
+# Concurrent GetAnswer calls; the connection pool is sized above this
+MAX_WORKERS = 16
+
+# Answer risks without notes or an improvement plan worth fetching
+NO_DETAIL_RISKS = frozenset({'UNANSWERED', 'NOT_APPLICABLE'})
+
+@lru_cache(maxsize=1)
+def get_wa_client():
+    """Create the Well-Architected client once and share it between data sources"""
+    return boto3.client(
+        'wellarchitected',
+        config=Config(max_pool_connections=2 * MAX_WORKERS, retries={'mode': 'adaptive'})
+    )
+
 class APIDataSource(DataSource):
     """API-based data source using Well-Architected API"""
 
-    def __init__(self, workload_id=None, lens_alias=None):
+    def __init__(self, workload_id=None, lens_alias=None, fetch_details=True):
         self.workload_id = workload_id
         self.lens_alias = lens_alias
-        self.wa_client = boto3.client('wellarchitected')
+        self.fetch_details = fetch_details
+        self.wa_client = get_wa_client()
         self.config = WAFFELConfig()
 
-    def get_workloads(self):
-        """Get all workloads from AWS Well-Architected Tool."""
-        workloads = []
-        response = self.wa_client.list_workloads(MaxResults=50)
-        workloads.extend(response['WorkloadSummaries'])
+    def _paginate(self, operation, result_key, **params):
+        """Yield items from every page of a NextToken-paginated API operation.
+
+        The Well-Architected service model ships no boto3 paginators for these
+        operations, so the NextToken handling lives here instead.
+        """
+        method = getattr(self.wa_client, operation)
+        params['MaxResults'] = 50
 
-        while 'NextToken' in response:
-            response = self.wa_client.list_workloads(MaxResults=50, NextToken=response['NextToken'])
-            workloads.extend(response['WorkloadSummaries'])
+        while True:
+            response = method(**params)
+            yield from response[result_key]
+            if 'NextToken' not in response:
+                return
+            params['NextToken'] = response['NextToken']
 
-        return workloads
+    def iter_workloads(self):
+        """Yield workload summaries page by page as they are listed."""
+        return self._paginate('list_workloads', 'WorkloadSummaries')
+
+    def get_workloads(self):
+        """Get all workloads from AWS Well-Architected Tool."""
+        return list(self.iter_workloads())
 
     def get_lenses(self, workload_id):
         """Get available lenses for a workload."""
@@ -34,18 +64,7 @@ class APIDataSource(DataSource):
 
     def get_answers(self, workload_id, lens_alias):
         """Get all answers for a workload and lens."""
-        params = {'WorkloadId': workload_id, 'LensAlias': lens_alias, 'MaxResults': 50}
-
-        answers = []
-        response = self.wa_client.list_answers(**params)
-        answers.extend(response['AnswerSummaries'])
-
-        while 'NextToken' in response:
-            params['NextToken'] = response['NextToken']
-            response = self.wa_client.list_answers(**params)
-            answers.extend(response['AnswerSummaries'])
-
-        return answers
+        return list(self._paginate('list_answers', 'AnswerSummaries', WorkloadId=workload_id, LensAlias=lens_alias))
 
     def get_answer_detail(self, workload_id, lens_alias, question_id):
         """Get detailed answer for a specific question."""
@@ -56,23 +75,20 @@ class APIDataSource(DataSource):
         """Interactive workload selection"""
         workloads = self.get_workloads()
 
-        choices = []
+        workload_ids = {}
         for w in workloads:
-            description = w.get('Description', 'No description')
-            if len(description) > 60:
-                description = description[:57] + "..."
-            choices.append(f"{w['WorkloadName']} - {description}")
+            description = truncate(w.get('Description', 'No description'), 60)
+            workload_ids[f"{w['WorkloadName']} - {description}"] = w['WorkloadId']
 
-        if not choices:
+        if not workload_ids:
             raise ValueError("No workloads found")
 
         workload_choice = inquirer.select(
             message="Select a workload:",
-            choices=choices
+            choices=list(workload_ids)
         ).execute()
 
-        workload_name = workload_choice.split(' - ')[0]
-        return next(w['WorkloadId'] for w in workloads if w['WorkloadName'] == workload_name)
+        return workload_ids[workload_choice]
 
     def select_lens_interactive(self, workload_id):
         """Interactive lens selection"""
@@ -81,97 +97,109 @@ class APIDataSource(DataSource):
         if not lenses:
             raise ValueError("No lenses found for this workload")
 
-        lens_choices = [l['LensName'] for l in lenses]
+        lens_aliases = {l['LensName']: l['LensAlias'] for l in lenses}
 
         lens_choice = inquirer.select(
             message="Select a lens:",
-            choices=lens_choices
+            choices=list(lens_aliases)
         ).execute()
 
-        return next(l['LensAlias'] for l in lenses if l['LensName'] == lens_choice)
-
-    def convert_api_to_standard_format(self, workload_id, lens_alias):
-        """Convert API data to standardized format matching PDF structure"""
-
-        # Get workload details
-        workload = self.wa_client.get_workload(WorkloadId=workload_id)['Workload']
-
-        # Get answers
-        answers = self.get_answers(workload_id, lens_alias)
+        return lens_aliases[lens_choice]
+
+    def _convert_answer(self, answer, detail):
+        """Convert an answer summary and its optional detail to the standard question format"""
+
+        # Count choice statistics
+        selected_choices = answer.get('SelectedChoices', [])
+        selected_count = len(selected_choices)
+        total_choices = len(answer.get('Choices', []))
+        not_selected_count = total_choices - selected_count
+
+        # Map API risk levels to Excel format
+        risk = answer.get('Risk', 'UNANSWERED')
+        risk_level = self.config.API_RISK_MAPPING.get(risk, 'Not Assessed')
+
+        # Convert to PDF-like format
+        question_data = {
+            'question_id': answer['QuestionId'],
+            'question': answer['QuestionTitle'],
+            'question_title': answer['QuestionTitle'],
+            'question_description': detail.get('QuestionDescription', ''),
+            'pillar': answer['PillarId'],
+            'risk_level': risk_level,
+            'notes': detail.get('Notes', ''),
+            'improvement_plan': '',  # Will be populated from unselected choices
+            'choices': [],
+            'stats': {
+                'selected': selected_count,
+                'not_selected': not_selected_count,
+                'na': 0  # API doesn't have N/A choices
+            },
+            'improvement_items': []
+        }
 
-        # Organize by pillars
-        pillars = defaultdict(list)
-        for answer in answers:
-            pillar = answer['PillarId']
-
-            # Get detailed answer
-            detail = self.get_answer_detail(workload_id, lens_alias, answer['QuestionId'])
-
-            # Count choice statistics
-            selected_choices = detail.get('SelectedChoices', [])
-            selected_count = len(selected_choices)
-            total_choices = len(detail.get('Choices', []))
-            not_selected_count = total_choices - selected_count
-
-            # Map API risk levels to Excel format
-            risk_mapping = {
-                'HIGH': 'High Risk',
-                'MEDIUM': 'Medium Risk',
-                'LOW': 'Low Risk',
-                'UNANSWERED': 'Not Assessed',
-                'NOT_APPLICABLE': 'Not Applicable'
-            }
-            risk_level = risk_mapping.get(answer.get('Risk', 'UNANSWERED'), 'Not Assessed')
-
-            # Convert to PDF-like format
-            question_data = {
-                'question_id': answer['QuestionId'],
-                'question': detail['QuestionTitle'],
-                'question_title': detail['QuestionTitle'],
-                'question_description': detail.get('QuestionDescription', ''),
-                'pillar': pillar,
-                'risk_level': risk_level,
-                'notes': detail.get('Notes', ''),
-                'improvement_plan': '',  # Will be populated from unselected choices
-                'choices': [],
-                'stats': {
-                    'selected': selected_count,
-                    'not_selected': not_selected_count,
-                    'na': 0  # API doesn't have N/A choices
-                },
-                'improvement_items': []
-            }
-
-            # Add choices
-            improvement_items = []
-            improvement_plan_text = []
-
-            for choice in detail.get('Choices', []):
-                is_selected = choice['ChoiceId'] in selected_choices
-                status = '✅ Selected' if is_selected else '⚠️ Not Selected'
-
-                question_data['choices'].append({
-                    'choice_id': choice['ChoiceId'],
-                    'choice': choice['Title'],  # Use 'choice' key to match PDF format
-                    'title': choice['Title'],
-                    'description': choice.get('Description', ''),
-                    'status': status
+        # Add choices
+        improvement_items = []
+        selected_set = set(selected_choices)
+        no_choice_id = f"{answer['QuestionId']}_no"
+        improvement_url = detail.get('ImprovementPlanUrl', '')
+
+        for choice in answer.get('Choices', []):
+            is_selected = choice['ChoiceId'] in selected_set
+            status = '✅ Selected' if is_selected else '⚠️ Not Selected'
+
+            question_data['choices'].append({
+                'choice_id': choice['ChoiceId'],
+                'choice': choice['Title'],  # Use 'choice' key to match PDF format
+                'title': choice['Title'],
+                'description': choice.get('Description', ''),
+                'status': status
+            })
+
+            # Add unselected choices as improvement items (excluding "None of these"),
+            # like the PDF report only once the question is answered and applicable
+            if risk not in NO_DETAIL_RISKS and not is_selected and choice['ChoiceId'] != no_choice_id and "None of these" not in choice['Title']:
+                improvement_items.append({
+                    'item': choice['Title'],
+                    'url': improvement_url
                 })
 
-                # Add unselected choices as improvement items (excluding "None of these")
-                if not is_selected and choice['ChoiceId'] != f"{answer['QuestionId']}_no" and "None of these" not in choice['Title']:
-                    improvement_url = detail.get('ImprovementPlanUrl', '')
-                    improvement_items.append({
-                        'item': choice['Title'],
-                        'url': improvement_url
-                    })
-                    improvement_plan_text.append(choice['Title'])
+        # Set improvement plan text and items
+        question_data['improvement_plan'] = '\n'.join(i['item'] for i in improvement_items)
+        question_data['improvement_items'] = improvement_items
+
+        return question_data
 
-            # Set improvement plan text and items
-            question_data['improvement_plan'] = '\n'.join(improvement_plan_text)
-            question_data['improvement_items'] = improvement_items
+    def convert_api_to_standard_format(self, workload_id, lens_alias):
+        """Convert API data to standardized format matching PDF structure"""
 
-            pillars[pillar].append(question_data)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Get workload details while the answers are listed
+            workload_future = executor.submit(self.wa_client.get_workload, WorkloadId=workload_id)
+
+            # Get answers
+            answers = self.get_answers(workload_id, lens_alias)
+
+            # Answer summaries already carry titles and choices; GetAnswer is only
+            # needed for notes, question descriptions and improvement plan URLs
+            details = {}
+            if self.fetch_details:
+                detail_answers = [a for a in answers if a.get('Risk', 'UNANSWERED') not in NO_DETAIL_RISKS]
+                details = dict(zip(
+                    (a['QuestionId'] for a in detail_answers),
+                    executor.map(
+                        lambda answer: self.get_answer_detail(workload_id, lens_alias, answer['QuestionId']),
+                        detail_answers
+                    )
+                ))
+
+            workload = workload_future.result()['Workload']
+
+        # Organize by pillars, keeping the lens order of the answers
+        pillars = {}
+        for answer in answers:
+            question_data = self._convert_answer(answer, details.get(answer['QuestionId'], {}))
+            pillars.setdefault(answer['PillarId'], []).append(question_data)
 
         workload_properties = {
             'Workload name': workload['WorkloadName'],
@@ -185,7 +213,7 @@ class APIDataSource(DataSource):
 
         return {
             'workload_properties': workload_properties,
-            'pillars': dict(pillars),
+            'pillars': pillars,
             'source_type': 'api',
             'source_info': f"Workload: {workload_id}"
         }
@@ -1,183 +1,400 @@
 #!/usr/bin/env python3
 """PDF data source implementation for Well-Architected reports."""
 
+import hashlib
+import json
 import logging
+import mmap
+import os
 import re
-from functools import lru_cache
-import PyPDF2
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 import requests
+
+# pypdf is the maintained successor of PyPDF2 with the same reader API
+try:
+    from pypdf import PdfReader
+except ImportError:
+    from PyPDF2 import PdfReader
+
+from ._common import PILLAR_ABBREVIATIONS, cache_path
 from .data_source import DataSource
 
 logger = logging.getLogger(__name__)
 
+# Reports with at least this many unread pages have their text extracted in worker processes
+PARALLEL_MIN_PAGES = 32
+
+_PILLAR_NAMES_BY_ABBREVIATION = {abbrev: name for name, abbrev in PILLAR_ABBREVIATIONS.items()}
+
+# Numbered question heading line ("3. How do you ..."); a heading with whitespace
+# after the number (group 2) also ends the previous question
+_QUESTION_LINE_RE = re.compile(r'^(\d+)\.([^\S\n]*)(.+)', re.MULTILINE)
+_STATUS_SUFFIX_RE = re.compile(r'\s*(Unanswered|Not Applicable)\s*$')
+
+_ARN_ACCOUNT_RE = re.compile(r':(\d{12}):')
+_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+
+# Labels of the workload properties section of the report
+_WORKLOAD_LABELS = frozenset({
+    'Workload name', 'ARN', 'Description', 'Review owner', 'Industry type', 'Industry',
+    'Environment', 'AWS Regions', 'Non-AWS regions', 'Account IDs', 'Architectural design'
+})
+
+# Page furniture stripped from improvement plan items
+_CLEAN_PLAN_RE = re.compile(r'Ask an expert|© \d+, Amazon Web Services.*?All rights reserved\.|Page \d+ of \d+')
+
+# A whole line holding a proper question ID, e.g. "SEC 7.How do you classify your data?"
+_PROPER_ID_LINE_RE = re.compile(r'^[^\S\n]*(OPS|SEC|REL|PERF|COST|SUS)[^\S\n]*(\d+)\.(.*\S)', re.IGNORECASE | re.MULTILINE)
+
+# Any text that can change the risk level or the section of a question
+_MARKER_RE = re.compile(
+    r'High risk|Medium risk|Low risk|No improvements identified|Selected choice\(s\)|'
+    r'Not selected choice\(s\)|Best Practices marked as Not Applicable|Notes|Improvement plan'
+)
+
+# Footer and call-to-action lines that are never content
+_NOISE_RE = re.compile(
+    r'© 2025, Amazon Web Services|Answer the question to view the improvement plan\.|Ask an expert|^(?=.*Page)(?=.*of)'
+)
+
+# Section words that keep a line out of the choice and notes lists
+_SECTION_WORD_RE = re.compile(r'Selected|Not selected|Best Practices|Notes|Improvement')
+_NOTES_SECTION_WORD_RE = re.compile(r'Selected|Not selected|Best Practices|Improvement')
+
+def _risk_level_marker(line, risk_level):
+    """Return the risk level a marker line sets, or the current one"""
+    if 'High risk' in line:
+        return 'High Risk'
+    if 'Medium risk' in line:
+        return 'Medium Risk'
+    if 'Low risk' in line:
+        return 'Low Risk'
+    if 'No improvements identified' in line:
+        return ''
+    return risk_level
+
+def _section_marker(line):
+    """Return the section a marker line starts, or None"""
+    if 'Selected choice(s)' in line:
+        return 'selected'
+    if 'Not selected choice(s)' in line:
+        return 'not_selected'
+    if 'Best Practices marked as Not Applicable' in line:
+        return 'na'
+    if 'Notes' in line and len(line) < 10:
+        return 'notes'
+    if 'Improvement plan' in line:
+        return 'improvement'
+    return None
+
+# Well-Architected TOC pages by framework base URL, shared by all PDF data sources
+_WA_TOC_CACHE = {}
+
+def _toc_cache_path(base_url):
+    """Return the on-disk TOC cache file for a framework base URL"""
+    digest = hashlib.sha256(base_url.encode('utf-8')).hexdigest()[:16]
+    return cache_path(f'wa_toc_{digest}.json')
+
+# Hyphens and spaces are dropped in a single translate pass when normalizing titles;
+# NUL is dropped too, as it separates the titles in the TOC search index
+_TITLE_NORM_TABLE = str.maketrans('', '', '- \0')
+
+def _normalize_title(text):
+    """Normalize an improvement item or TOC title for substring matching"""
+    return text.lower().translate(_TITLE_NORM_TABLE).replace('events', 'alerts')
+
+def _fetch_wa_framework_urls(base_url):
+    """Download the framework TOC as (title, url) pairs, or [] on failure"""
+    try:
+        res = requests.get(f'{base_url}/toc-contents.json', timeout=10)  # nosec B113
+        res.raise_for_status()
+        toc = res.json()
+        all_pages = []
+        def _process(toc):
+            for t in toc:
+                if 'contents' in t:
+                    _process(t['contents'])
+                all_pages.append((t['title'], f'{base_url}/{t["href"]}'))
+        _process(toc['contents'])
+        return all_pages
+    except:  # pylint: disable=bare-except
+        return []
+
+def _extract_page_texts(pdf_path, page_nums):
+    """Extract the text of the given 1-based pages in a worker process"""
+    with open(pdf_path, 'rb') as pdf_file, mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as pdf_map:
+        reader = PdfReader(pdf_map)
+        return [reader.pages[page_num - 1].extract_text() for page_num in page_nums]
+
 class PDFDataSource(DataSource):
     """PDF-based data source with all PDF parsing logic"""
 
     def __init__(self, pdf_path):
         self.pdf_path = pdf_path
+        self._file = None
+        self._map = None
+        self._reader = None
+        self._page_texts = {}
+        self._wa_pages_norm = {}
+
+    def _get_reader(self):
+        """Open the PDF once and share the parsed reader between extraction passes
+
+        The file is memory-mapped, so the reader's random xref and object reads
+        are served from the page cache instead of seek and read calls.
+        """
+        if self._reader is None:
+            self._file = open(self.pdf_path, 'rb')  # pylint: disable=consider-using-with
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._reader = PdfReader(self._map)
+        return self._reader
+
+    def _page_text(self, page_num):
+        """Return the extracted text of a 1-based page number, extracting it only once"""
+        if page_num not in self._page_texts:
+            self._page_texts[page_num] = self._get_reader().pages[page_num - 1].extract_text()
+        return self._page_texts[page_num]
+
+    def _extract_all_page_texts(self):
+        """Extract every page up front, spreading long reports over worker processes
+
+        Text extraction dominates parsing time and pages are independent, while
+        the question parsing carries its pillar from page to page and stays
+        sequential over the cached text.
+        """
+        page_nums = [n for n in range(1, len(self._get_reader().pages) + 1) if n not in self._page_texts]
+        workers = min(os.cpu_count() or 1, len(page_nums) // PARALLEL_MIN_PAGES + 1)
+        if len(page_nums) < PARALLEL_MIN_PAGES or workers < 2:
+            return
+
+        # Interleave pages so every worker gets a similar mix of page sizes
+        batches = [page_nums[offset::workers] for offset in range(workers)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for batch, texts in zip(batches, executor.map(_extract_page_texts, [self.pdf_path] * workers, batches)):
+                    self._page_texts.update(zip(batch, texts))
+        except Exception as exc:
+            # Pages not extracted here are read lazily in this process
+            logger.debug(f"Parallel page extraction unavailable: {exc}")
+
+    def close(self):
+        """Close the PDF file and drop cached page text"""
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._map = None
+        self._file = None
+        self._reader = None
+        self._page_texts = {}
 
     def extract_workload_properties(self):
         """Extract workload properties from PDF"""
 
-        with open(self.pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-
-            workload_props = {}
-
-            # Extract text from first few pages
-            for page in reader.pages[:5]:
-                text = page.extract_text()
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-                # Find workload properties section
-                for i, line in enumerate(lines):
-                    if line == 'Workload properties':
-                        # Process the properties that follow
-                        j = i + 1
-                        current_property = None
-
-                        while j < len(lines):
-                            line = lines[j]
-
-                            # Skip copyright and page info
-                            if '©' in line or 'Page ' in line:
-                                break
-
-                            # Property labels
-                            if line in ['Workload name', 'ARN', 'Description', 'Review owner',
-                                       'Industry type', 'Industry', 'Environment', 'AWS Regions',
-                                       'Non-AWS regions', 'Account IDs', 'Architectural design']:
-                                current_property = line
-                            elif current_property and line != '-':
-                                # Handle multi-line values
-                                if current_property == 'ARN':
-                                    # Combine ARN parts
-                                    arn_parts = [line]
-                                    k = j + 1
-                                    while k < len(lines) and not lines[k] in ['Description', 'Review owner']:
-                                        if not ('©' in lines[k] or 'Page ' in lines[k]):
-                                            arn_parts.append(lines[k])
-                                        k += 1
-                                    workload_props[current_property] = ''.join(arn_parts)
-                                    j = k - 1
-                                elif current_property == 'Description':
-                                    # Combine description parts
-                                    desc_parts = [line]
-                                    k = j + 1
-                                    while k < len(lines) and not lines[k] in ['Review owner', 'Industry type']:
-                                        if not ('©' in lines[k] or 'Page ' in lines[k]):
-                                            desc_parts.append(lines[k])
-                                        k += 1
-                                    workload_props[current_property] = ' '.join(desc_parts)
-                                    j = k - 1
-                                else:
-                                    workload_props[current_property] = line
-                                current_property = None
-                            elif current_property and line == '-':
-                                # Handle dash values (empty fields)
-                                if current_property == 'Non-AWS regions':
-                                    workload_props[current_property] = '-'
-                                elif current_property == 'Account IDs':
-                                    workload_props[current_property] = '-'
-                                current_property = None
-
-                            j += 1
-
-                        # Add missing fields with default values if not found
-                        if 'Account IDs' not in workload_props or workload_props.get('Account IDs') == '-':
-                            # Try to extract from ARN
-                            if 'ARN' in workload_props:
-                                arn_match = re.search(r':(\d{12}):', workload_props['ARN'])
-                                if arn_match:
-                                    workload_props['Account IDs'] = arn_match.group(1)
-
-                        if 'Date' not in workload_props:
-                            # Look for date in architectural design or elsewhere
-                            for prop, value in workload_props.items():
-                                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', str(value))
-                                if date_match:
-                                    workload_props['Date'] = date_match.group(1)
-                                    # Clean the original property
-                                    workload_props[prop] = re.sub(r'\d{1,2}/\d{1,2}/\d{4}', '', str(value)).strip()
-                                    if not workload_props[prop]:
-                                        workload_props[prop] = 'Application'
-                                    break
-
-                        return workload_props
+        reader = self._get_reader()
+
+        workload_props = {}
 
+        # Find the workload properties section in the first few pages; pages past
+        # the one holding it are never extracted
+        for page_num in range(1, min(5, len(reader.pages)) + 1):
+            text = self._page_text(page_num)
+            lines = [line for line in map(str.strip, text.split('\n')) if line]
+            if 'Workload properties' in lines:
+                break
+        else:
             return workload_props
 
+        # Process the properties that follow
+        j = lines.index('Workload properties') + 1
+        current_property = None
+
+        while j < len(lines):
+            line = lines[j]
+
+            # Skip copyright and page info
+            if '©' in line or 'Page ' in line:
+                break
+
+            # Property labels
+            if line in _WORKLOAD_LABELS:
+                current_property = line
+            elif current_property and line != '-':
+                # Handle multi-line values
+                if current_property == 'ARN':
+                    # Combine ARN parts
+                    arn_parts = [line]
+                    k = j + 1
+                    while k < len(lines) and lines[k] not in ('Description', 'Review owner'):
+                        if not ('©' in lines[k] or 'Page ' in lines[k]):
+                            arn_parts.append(lines[k])
+                        k += 1
+                    workload_props[current_property] = ''.join(arn_parts)
+                    j = k - 1
+                elif current_property == 'Description':
+                    # Combine description parts
+                    desc_parts = [line]
+                    k = j + 1
+                    while k < len(lines) and lines[k] not in ('Review owner', 'Industry type'):
+                        if not ('©' in lines[k] or 'Page ' in lines[k]):
+                            desc_parts.append(lines[k])
+                        k += 1
+                    workload_props[current_property] = ' '.join(desc_parts)
+                    j = k - 1
+                else:
+                    workload_props[current_property] = line
+                current_property = None
+            elif current_property and line == '-':
+                # Handle dash values (empty fields)
+                if current_property == 'Non-AWS regions':
+                    workload_props[current_property] = '-'
+                elif current_property == 'Account IDs':
+                    workload_props[current_property] = '-'
+                current_property = None
+
+            j += 1
+
+        # Add missing fields with default values if not found
+        if 'Account IDs' not in workload_props or workload_props.get('Account IDs') == '-':
+            # Try to extract from ARN
+            if 'ARN' in workload_props:
+                arn_match = _ARN_ACCOUNT_RE.search(workload_props['ARN'])
+                if arn_match:
+                    workload_props['Account IDs'] = arn_match.group(1)
+
+        if 'Date' not in workload_props:
+            # Look for date in architectural design or elsewhere
+            for prop, value in workload_props.items():
+                date_match = _DATE_RE.search(str(value))
+                if date_match:
+                    workload_props['Date'] = date_match.group(0)
+                    # Clean the original property
+                    workload_props[prop] = _DATE_RE.sub('', str(value)).strip()
+                    if not workload_props[prop]:
+                        workload_props[prop] = 'Application'
+                    break
+
+        return workload_props
+
     def extract_hyperlinks_from_pdf(self):
         """Extract hyperlinks from PDF annotations by page"""
 
         hyperlinks_by_page = {}
-        with open(self.pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
+        reader = self._get_reader()
+
+        for page_num, page in enumerate(reader.pages, 1):
+            page_links = hyperlinks_by_page[page_num] = []
 
-            for page_num, page in enumerate(reader.pages, 1):
-                hyperlinks_by_page[page_num] = []
+            # Raw lookups skip resolving entries that cannot hold a URI
+            annots = page.get('/Annots')
+            if annots is None:
+                continue
+
+            # The annotations array is often an indirect object itself; resolve it once
+            try:
+                annots = annots.get_object()
+            except Exception as exc:
+                logger.exception(exc)
+                continue
+
+            for annot_ref in annots:
                 try:
-                    if '/Annots' in page:
-                        annotations = page['/Annots']
-                        for annot_ref in annotations:
-                            try:
-                                annot = annot_ref.get_object()
-                                if '/A' in annot and '/URI' in annot['/A']:
-                                    uri = str(annot['/A']['/URI'])
-                                    hyperlinks_by_page[page_num].append(uri)
-                            except Exception:  # nosec B112
-                                continue
-                except Exception as exc:
-                    logger.exception(exc)
+                    annot = annot_ref.get_object()
+                    if annot.get('/Subtype') != '/Link':
+                        continue
+                    action = annot.get('/A')
+                    uri = action.get_object().get('/URI') if action is not None else None
+                    if uri is not None:
+                        page_links.append(str(uri.get_object()))
+                except Exception:  # nosec B112
                     continue
 
         return hyperlinks_by_page
 
-    @lru_cache(maxsize=100)
-    def get_wa_framework_urls(self, base_url="https://docs.aws.amazon.com/wellarchitected/2025-02-25/framework"):
-        """Fetch all Well-Architected Framework URLs dynamically with caching"""
+    @staticmethod
+    def get_wa_framework_urls(base_url="https://docs.aws.amazon.com/wellarchitected/2025-02-25/framework"):
+        """Fetch all Well-Architected Framework URLs dynamically with caching
+
+        Each dated framework version has a fixed table of contents, so results are
+        kept per base URL for the whole process and on disk across runs.
+        """
+        if base_url in _WA_TOC_CACHE:
+            return _WA_TOC_CACHE[base_url]
+
+        toc_path = _toc_cache_path(base_url)
         try:
-            res = requests.get(f'{base_url}/toc-contents.json', timeout=10)  # nosec B113
-            res.raise_for_status()
-            toc = res.json()
-            all_pages = []
-            def _process(toc):
-                for t in toc:
-                    if 'contents' in t:
-                        _process(t['contents'])
-                    all_pages.append((t['title'], f'{base_url}/{t["href"]}'))
-            _process(toc['contents'])
-            return all_pages
-        except:  # pylint: disable=bare-except
-            return []
+            with open(toc_path, encoding='utf-8') as cache_file:
+                all_pages = [tuple(page) for page in json.load(cache_file)]
+        except (OSError, ValueError):
+            all_pages = _fetch_wa_framework_urls(base_url)
+            if all_pages:
+                try:
+                    os.makedirs(os.path.dirname(toc_path), exist_ok=True)
+                    with open(toc_path, 'w', encoding='utf-8') as cache_file:
+                        json.dump(all_pages, cache_file)
+                except OSError as exc:
+                    logger.debug(f'Cannot write TOC cache {toc_path}: {exc}')
 
-    def match_improvement_item_to_url(self, item_text, available_urls):
-        """Match improvement item text directly against TOC titles"""
+        _WA_TOC_CACHE[base_url] = all_pages
+        return all_pages
 
-        base_urls = {
+    def _get_wa_title_index(self, available_urls):
+        """Return a search index over the TOC titles of the framework versions linked in available_urls
+
+        The index is (titles, offsets, urls): the normalized titles joined by NUL,
+        the start offset of each title in that string, and the matching URLs.
+        """
+
+        base_urls = frozenset(
             url.rsplit('/', 1)[0]
             for url in available_urls
             if 'https://docs.aws.amazon.com/wellarchitected/' in url
-        }
+        )
+
+        # Get all TOC pages (cached) and index their normalized titles once per set of versions
+        if base_urls not in self._wa_pages_norm:
+            wa_pages = chain.from_iterable(self.get_wa_framework_urls(base_url) for base_url in base_urls)
+            offsets, urls, titles = [], [], []
+            offset = 0
+            for title, url in wa_pages:
+                title = _normalize_title(title)
+                offsets.append(offset)
+                urls.append(url)
+                titles.append(title)
+                offset += len(title) + 1
+            self._wa_pages_norm[base_urls] = ('\0'.join(titles), offsets, urls)
+        return self._wa_pages_norm[base_urls]
+
+    def match_improvement_item_to_url(self, item_text, available_urls):
+        """Match improvement item text directly against TOC titles"""
+        return self._match_many([item_text], available_urls)[0]
 
-        # Get all TOC pages (cached)
-        wa_pages = sum([self.get_wa_framework_urls(base_url) for base_url in base_urls], [])
-        if not wa_pages:
-            logger.warning(f'Cannot read urls. No match for {item_text}')
-            return ''
+    def _match_many(self, item_texts, available_urls):
+        """Match several improvement items against the TOC titles, looking up the index once"""
 
-        # Direct text matching against TOC titles
-        item_lower = item_text.lower().replace('-',' ').replace(' ','').replace('events', 'alerts')
+        titles, offsets, urls = self._get_wa_title_index(available_urls)
+        if not urls:
+            for item_text in item_texts:
+                logger.warning(f'Cannot read urls. No match for {item_text}')
+            return [''] * len(item_texts)
 
-        # First pass: exact substring matching
-        for title, url in wa_pages:
-            title_lower = title.lower().replace('-',' ').replace(' ','').replace('events', 'alerts')
-            # Check if improvement item text contains the TOC title
-            if item_lower in title_lower:
-                return url
+        matched_urls = []
+        for item_text in item_texts:
+            # Direct text matching against TOC titles
+            item_lower = _normalize_title(item_text)
 
-        logger.warning(f'Failed to match {item_text}')
-        return ''
+            # The first title containing the item text wins; one scan of the joined
+            # titles finds it, since the item holds no NUL to cross a title boundary
+            position = titles.find(item_lower)
+            if position != -1:
+                matched_urls.append(urls[bisect_right(offsets, position) - 1])
+            else:
+                logger.warning(f'Failed to match {item_text}')
+                matched_urls.append('')
+
+        return matched_urls
 
     def extract_improvement_plan_with_smart_urls(self):
         """Extract Well-Architected data with smart URL matching"""
@@ -185,300 +402,246 @@ class PDFDataSource(DataSource):
         # First extract all hyperlinks by page
         hyperlinks_by_page = self.extract_hyperlinks_from_pdf()
 
-        with open(self.pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-
-            pillars = {
-                'Operational Excellence': [],
-                'Security': [],
-                'Reliability': [],
-                'Performance Efficiency': [],
-                'Cost Optimization': [],
-                'Sustainability': []
-            }
-
-            # PASS 1: Collect proper question IDs and their pillar mappings
-            question_pillar_map = {}  # Maps (question_number, question_text_start) to pillar
-
-            for page_num, page in enumerate(reader.pages, 1):
-                text = page.extract_text()
-                lines = text.split('\n')
-
-                for line in lines:
-                    line = line.strip()
-                    # Look for proper question ID patterns (e.g., "SEC 7.How do you classify your data?")
-                    proper_id_match = re.match(r'^(OPS|SEC|REL|PERF|COST|SUS)\s*(\d+)\.(.+)', line, re.IGNORECASE)
-                    if proper_id_match:
-                        pillar_abbrev = proper_id_match.group(1).upper()
-                        q_num = int(proper_id_match.group(2))
-                        q_text = proper_id_match.group(3).strip()
-
-                        # Map abbreviations to full pillar names
-                        pillar_map = {
-                            'OPS': 'Operational Excellence',
-                            'SEC': 'Security',
-                            'REL': 'Reliability',
-                            'PERF': 'Performance Efficiency',
-                            'COST': 'Cost Optimization',
-                            'SUS': 'Sustainability'
-                        }
-                        pillar_name = pillar_map.get(pillar_abbrev, 'Unknown')
-
-                        # Use first few words of question as key to distinguish between pillars
-                        question_key_words = ' '.join(q_text.lower().split()[:4])
-                        composite_key = (q_num, question_key_words)
-                        question_pillar_map[composite_key] = (pillar_name, pillar_abbrev)
-
-            # PASS 2: Process actual questions using the pillar mappings
-            current_pillar = None
-
-            for page_num, page in enumerate(reader.pages, 1):
-                text = page.extract_text()
-                lines = text.split('\n')
-
-                i = 0
-                while i < len(lines):
-                    line = lines[i].strip()
-
-                    # Initialize variables
-                    q_num = None
-                    q_text = None
-                    j = i + 1
-                    used_proper_id = False
-
-                    # Try to match question pattern
-                    match = re.match(r'^(\d+)\.\s*(.+)', line)
-                    if match:
-                        q_num = int(match.group(1))
-                        q_text = match.group(2)
-
-                        # Continue reading question if it spans multiple lines
-                        while j < len(lines):
-                            next_line = lines[j].strip()
-                            if (next_line.startswith(('Selected', 'Not selected', 'Best Practices', 'High risk', 'Medium risk', 'Low risk', 'No improvements', 'Unanswered'))
-                                or re.match(r'^\d+\.\s', next_line)):
-                                break
-                            if next_line and len(next_line) > 3 and next_line != 'Unanswered':
-                                q_text += " " + next_line
-                            j += 1
-
-                        # Clean question text
-                        q_text = re.sub(r'\s*(Unanswered|Not Applicable)\s*$', '', q_text)
-                        q_text = q_text.strip()
-
-                        # Use proper pillar mapping if available, otherwise fall back to content-based detection
-                        question_key_words = ' '.join(q_text.lower().split()[:4])
-                        composite_key = (q_num, question_key_words)
-
-                        if composite_key in question_pillar_map:
-                            current_pillar, pillar_abbrev = question_pillar_map[composite_key]
-                            used_proper_id = True
-                        else:
-                            # Fallback to old logic
-                            if q_num <= 11 and current_pillar is None:
-                                current_pillar = 'Operational Excellence'
-                            elif 'securely operate' in q_text.lower() or 'security' in q_text.lower():
-                                current_pillar = 'Security'
-                            elif 'service quotas' in q_text.lower() or 'network topology' in q_text.lower():
-                                current_pillar = 'Reliability'
-                            elif 'appropriate cloud resources' in q_text.lower() or 'compute resources' in q_text.lower():
-                                current_pillar = 'Performance Efficiency'
-                            elif 'financial management' in q_text.lower() or 'cost' in q_text.lower():
-                                current_pillar = 'Cost Optimization'
-                            elif 'select Regions' in q_text.lower() or 'sustainability' in q_text.lower():
-                                current_pillar = 'Sustainability'
-
-                    # If we found a question, process it
-                    if q_num is not None and q_text is not None:
-
-                        # Extract all data (same as before)
-                        selected_choices = []
-                        not_selected_choices = []
-                        na_choices = []
-                        improvement_plans = []
-                        notes = []
-                        question_risk_level = ''
-
-                        # Process following lines
-                        section = 'none'
-
-                        while j < len(lines) and not re.match(r'^\d+\.\s', lines[j].strip()):
-                            next_line = lines[j].strip()
-
-                            # Check for risk levels
-                            if 'High risk' in next_line:
-                                question_risk_level = 'High Risk'
-                            elif 'Medium risk' in next_line:
-                                question_risk_level = 'Medium Risk'
-                            elif 'Low risk' in next_line:
-                                question_risk_level = 'Low Risk'
-                            elif 'No improvements identified' in next_line:
-                                question_risk_level = ''
-
-                            # Identify sections
-                            if 'Selected choice(s)' in next_line:
-                                section = 'selected'
-                            elif 'Not selected choice(s)' in next_line:
-                                section = 'not_selected'
-                            elif 'Best Practices marked as Not Applicable' in next_line:
-                                section = 'na'
-                            elif 'Notes' in next_line and len(next_line) < 10:
-                                section = 'notes'
-                            elif 'Improvement plan' in next_line:
-                                section = 'improvement'
-                            elif next_line in {'-', 'Unanswered'}:
-                                pass
-                            elif next_line and len(next_line) > 5:
-                                if ('© 2025, Amazon Web Services' in next_line or
-                                    'Page' in next_line and 'of' in next_line or
-                                    'Answer the question to view the improvement plan.' in next_line or
-                                    'Ask an expert' in next_line):
-                                    pass
-                                elif section == 'selected' and not any(x in next_line for x in ['Selected', 'Not selected', 'Best Practices', 'Notes', 'Improvement']):
-                                    selected_choices.append(next_line)
-                                elif section == 'not_selected' and not any(x in next_line for x in ['Selected', 'Not selected', 'Best Practices', 'Notes', 'Improvement']):
-                                    not_selected_choices.append(next_line)
-                                elif section == 'na' and not any(x in next_line for x in ['Selected', 'Not selected', 'Best Practices', 'Notes', 'Improvement']):
-                                    na_choices.append(next_line)
-                                elif section == 'notes' and not any(x in next_line for x in ['Selected', 'Not selected', 'Best Practices', 'Improvement']):
-                                    notes.append(next_line)
-                                elif section == 'improvement':
-                                    if ('Ask an expert' not in next_line and
-                                        'Answer the question to view' not in next_line and
-                                        '© 2025, Amazon Web Services' not in next_line and
-                                        not re.match(r'.*Page \d+ of \d+', next_line) and
-                                        'No risk detected for this question. No action needed' not in next_line and
-                                        len(next_line) > 10):
-                                        # Check if this line starts with capital letter (new item) or lowercase (continuation)
-                                        if next_line[0].isupper() or not improvement_plans:
-                                            improvement_plans.append(next_line)
-                                        else:
-                                            # Continuation of previous item
-                                            if improvement_plans:
-                                                improvement_plans[-1] += " " + next_line
-
-                            j += 1
-
-                        # Filter out "None of these" if other options exist
-                        def filter_none_of_these(choices, other_choices_exist):
-                            if other_choices_exist:
-                                return [choice for choice in choices if 'None of these' not in choice]
-                            return choices
-
-                        has_other_selected = any('None of these' not in choice for choice in selected_choices)
-                        has_other_not_selected = any('None of these' not in choice for choice in not_selected_choices)
-                        has_other_na = any('None of these' not in choice for choice in na_choices)
-
-                        if has_other_selected or has_other_not_selected or has_other_na:
-                            selected_choices = filter_none_of_these(selected_choices, True)
-                            not_selected_choices = filter_none_of_these(not_selected_choices, True)
-                            na_choices = filter_none_of_these(na_choices, True)
-
-                        # Generate question ID - use proper abbreviation if available
-                        if used_proper_id:
-                            question_id = f"{pillar_abbrev}-{q_num:02d}"
-                        else:
-                            # Fallback to old abbreviation mapping
-                            pillar_abbrev_map = {
-                                'Operational Excellence': 'OPS',
-                                'Security': 'SEC',
-                                'Reliability': 'REL',
-                                'Performance Efficiency': 'PERF',
-                                'Cost Optimization': 'COST',
-                                'Sustainability': 'SUS'
-                            }
-                            question_id = f"{pillar_abbrev_map.get(current_pillar, 'UNK')}-{q_num:02d}"
-
-                        # Clean improvement plans and get URLs for this page
-                        clean_improvement_plans = []
-                        page_urls = hyperlinks_by_page.get(page_num, [])
-
-                        for plan in improvement_plans:
-                            clean_plan = re.sub(r'Ask an expert', '', plan)
-                            clean_plan = re.sub(r'© \d+, Amazon Web Services.*?All rights reserved\.', '', clean_plan)
-                            clean_plan = re.sub(r'Page \d+ of \d+', '', clean_plan)
-                            clean_plan = clean_plan.strip()
-                            if clean_plan and len(clean_plan) > 5:
-                                clean_improvement_plans.append(clean_plan)
-
-                        improvement_text = '\n'.join(clean_improvement_plans) if clean_improvement_plans else ''
-                        notes_text = '\n'.join(notes) if notes else ''
-
-                        # Determine overall risk (only show if there are not selected items)
-                        overall_risk = question_risk_level if not_selected_choices else ''
-
-                        # Create question data structure
-                        question_data = {
-                            'question_id': question_id,
-                            'pillar': current_pillar,
-                            'question': q_text,
-                            'risk_level': overall_risk,
-                            'notes': notes_text,
-                            'improvement_plan': improvement_text,
-                            'choices': [],
-                            'stats': {
-                                'selected': len(selected_choices),
-                                'not_selected': len(not_selected_choices),
-                                'na': len(na_choices)
-                            },
-                            'improvement_items': []
-                        }
-
-                        # Add all choices
-                        for choice in selected_choices:
-                            question_data['choices'].append({
-                                'choice': choice,
-                                'status': '✅ Selected'
-                            })
-
-                        for choice in not_selected_choices:
-                            question_data['choices'].append({
-                                'choice': choice,
-                                'status': '⚠️ Not Selected'
-                            })
-
-                        for choice in na_choices:
-                            question_data['choices'].append({
-                                'choice': choice,
-                                'status': 'Not Applicable'
-                            })
-
-                        # Add improvement plan items with smart URL matching
-                        for plan in clean_improvement_plans:
-                            # Use smart matching to find the best URL for this specific improvement item
-                            matched_url = self.match_improvement_item_to_url(plan, page_urls)
-
-                            question_data['improvement_items'].append({
-                                'item': plan,
-                                'url': matched_url
-                            })
-
-                        # If no choices, add placeholder
-                        if not question_data['choices']:
-                            question_data['choices'].append({
-                                'choice': 'Assessment not completed - no choices identified',
-                                'status': '⚠️ Not Selected'
-                            })
-                            question_data['stats'] = {'selected': 0, 'not_selected': 1, 'na': 0}
-
-                        # Add to pillar
-                        if current_pillar:
-                            pillars[current_pillar].append(question_data)
-
-                        i = j - 1
+        reader = self._get_reader()
+        self._extract_all_page_texts()
+
+        pillars = {
+            'Operational Excellence': [],
+            'Security': [],
+            'Reliability': [],
+            'Performance Efficiency': [],
+            'Cost Optimization': [],
+            'Sustainability': []
+        }
+
+        # PASS 1: Collect proper question IDs and their pillar mappings
+        question_pillar_map = {}  # Maps (question_number, question_text_start) to pillar
+
+        for page_num in range(1, len(reader.pages) + 1):
+            # Look for proper question ID lines in one sweep over the page text
+            for proper_id_match in _PROPER_ID_LINE_RE.finditer(self._page_text(page_num)):
+                pillar_abbrev = proper_id_match.group(1).upper()
+                q_num = int(proper_id_match.group(2))
+                q_text = proper_id_match.group(3).strip()
+
+                # Map abbreviations to full pillar names
+                pillar_name = _PILLAR_NAMES_BY_ABBREVIATION.get(pillar_abbrev, 'Unknown')
+
+                # Use first few words of question as key to distinguish between pillars
+                question_key_words = ' '.join(q_text.lower().split()[:4])
+                composite_key = (q_num, question_key_words)
+                question_pillar_map[composite_key] = (pillar_name, pillar_abbrev)
+
+        # PASS 2: Process actual questions using the pillar mappings
+        current_pillar = None
+
+        for page_num in range(1, len(reader.pages) + 1):
+            text = self._page_text(page_num)
+            lines = [line.strip() for line in text.split('\n')]
+            page_text = '\n'.join(lines)
+
+            # Find every question heading of the page in one sweep, with its line index
+            headers = []
+            line_idx = 0
+            last_pos = 0
+            for match in _QUESTION_LINE_RE.finditer(page_text):
+                line_idx += page_text.count('\n', last_pos, match.start())
+                last_pos = match.start()
+                headers.append((line_idx, match))
+
+            # Headings with whitespace after the number end the previous question
+            question_start_lines = [idx for idx, header in headers if header.group(2)]
+
+            end = 0
+            for line_idx, match in headers:
+                # Skip headings inside the question processed last
+                if line_idx < end:
+                    continue
+
+                # A question runs up to the next question heading
+                next_start = bisect_right(question_start_lines, line_idx)
+                end = question_start_lines[next_start] if next_start < len(question_start_lines) else len(lines)
+
+                j = line_idx + 1
+                used_proper_id = False
+
+                q_num = int(match.group(1))
+                q_parts = [match.group(3)]
+
+                # Continue reading question if it spans multiple lines
+                while j < end:
+                    next_line = lines[j]
+                    if next_line.startswith(('Selected', 'Not selected', 'Best Practices', 'High risk', 'Medium risk', 'Low risk', 'No improvements', 'Unanswered')):
+                        break
+                    if next_line and len(next_line) > 3 and next_line != 'Unanswered':
+                        q_parts.append(next_line)
+                    j += 1
+
+                # Clean question text
+                q_text = _STATUS_SUFFIX_RE.sub('', ' '.join(q_parts))
+                q_text = q_text.strip()
+
+                # Use proper pillar mapping if available, otherwise fall back to content-based detection
+                question_key_words = ' '.join(q_text.lower().split()[:4])
+                composite_key = (q_num, question_key_words)
+
+                if composite_key in question_pillar_map:
+                    current_pillar, pillar_abbrev = question_pillar_map[composite_key]
+                    used_proper_id = True
+                else:
+                    # Fallback to old logic
+                    if q_num <= 11 and current_pillar is None:
+                        current_pillar = 'Operational Excellence'
+                    elif 'securely operate' in q_text.lower() or 'security' in q_text.lower():
+                        current_pillar = 'Security'
+                    elif 'service quotas' in q_text.lower() or 'network topology' in q_text.lower():
+                        current_pillar = 'Reliability'
+                    elif 'appropriate cloud resources' in q_text.lower() or 'compute resources' in q_text.lower():
+                        current_pillar = 'Performance Efficiency'
+                    elif 'financial management' in q_text.lower() or 'cost' in q_text.lower():
+                        current_pillar = 'Cost Optimization'
+                    elif 'select Regions' in q_text.lower() or 'sustainability' in q_text.lower():
+                        current_pillar = 'Sustainability'
+
+                # Extract all data (same as before)
+                # Choices per section, split into (other choices, "None of these" choices) as they are read
+                choices_by_section = {'selected': ([], []), 'not_selected': ([], []), 'na': ([], [])}
+                improvement_parts = []  # Lines of each improvement item
+                notes = []
+                question_risk_level = ''
+
+                # Process following lines
+                section = 'none'
+
+                while j < end:
+                    next_line = lines[j]
+
+                    # Only lines containing a marker can change the risk level or section
+                    if _MARKER_RE.search(next_line):
+                        question_risk_level = _risk_level_marker(next_line, question_risk_level)
+                        new_section = _section_marker(next_line)
                     else:
-                        # No question pattern found, continue to next line
+                        new_section = None
+
+                    # Identify sections
+                    if new_section:
+                        section = new_section
+                    elif next_line in {'-', 'Unanswered'}:
                         pass
+                    elif next_line and len(next_line) > 5:
+                        if _NOISE_RE.search(next_line):
+                            pass
+                        elif section in ('selected', 'not_selected', 'na') and not _SECTION_WORD_RE.search(next_line):
+                            choices_by_section[section]['None of these' in next_line].append(next_line)
+                        elif section == 'notes' and not _NOTES_SECTION_WORD_RE.search(next_line):
+                            notes.append(next_line)
+                        elif section == 'improvement':
+                            # Copyright, page and "Ask an expert" lines were already skipped as noise
+                            if ('Answer the question to view' not in next_line and
+                                'No risk detected for this question. No action needed' not in next_line and
+                                len(next_line) > 10):
+                                # Items are cleaned once here, so later passes only see real content
+                                clean_line = _CLEAN_PLAN_RE.sub('', next_line).strip()
+
+                                # Check if this line starts with capital letter (new item) or lowercase (continuation)
+                                if next_line[0].isupper() or not improvement_parts:
+                                    if len(clean_line) > 5:
+                                        improvement_parts.append([clean_line])
+                                elif clean_line:
+                                    # Continuation of previous item
+                                    improvement_parts[-1].append(clean_line)
+
+                    j += 1
+
+                # Filter out "None of these" if other options exist
+                has_other_choices = any(others for others, _ in choices_by_section.values())
+                selected_choices, not_selected_choices, na_choices = (
+                    others if has_other_choices else none_of_these
+                    for others, none_of_these in choices_by_section.values()
+                )
+
+                # Generate question ID - use proper abbreviation if available
+                if used_proper_id:
+                    question_id = f"{pillar_abbrev}-{q_num:02d}"
+                else:
+                    # Fallback to old abbreviation mapping
+                    question_id = f"{PILLAR_ABBREVIATIONS.get(current_pillar, 'UNK')}-{q_num:02d}"
+
+                # Get URLs for this page
+                page_urls = hyperlinks_by_page.get(page_num, [])
+
+                # Join each item's lines, then match all items of the question in one batch
+                improvement_plans = [' '.join(parts) for parts in improvement_parts]
+                improvement_items = [
+                    {'item': plan, 'url': url}
+                    for plan, url in zip(improvement_plans, self._match_many(improvement_plans, page_urls))
+                ] if improvement_plans else []
+
+                improvement_text = '\n'.join(improvement_plans)
+                notes_text = '\n'.join(notes) if notes else ''
+
+                # Determine overall risk (only show if there are not selected items)
+                overall_risk = question_risk_level if not_selected_choices else ''
+
+                # Create question data structure
+                question_data = {
+                    'question_id': question_id,
+                    'pillar': current_pillar,
+                    'question': q_text,
+                    'risk_level': overall_risk,
+                    'notes': notes_text,
+                    'improvement_plan': improvement_text,
+                    'choices': [],
+                    'stats': {
+                        'selected': len(selected_choices),
+                        'not_selected': len(not_selected_choices),
+                        'na': len(na_choices)
+                    },
+                    'improvement_items': improvement_items
+                }
+
+                # Add all choices
+                for choice in selected_choices:
+                    question_data['choices'].append({
+                        'choice': choice,
+                        'status': '✅ Selected'
+                    })
+
+                for choice in not_selected_choices:
+                    question_data['choices'].append({
+                        'choice': choice,
+                        'status': '⚠️ Not Selected'
+                    })
+
+                for choice in na_choices:
+                    question_data['choices'].append({
+                        'choice': choice,
+                        'status': 'Not Applicable'
+                    })
+
+                # If no choices, add placeholder
+                if not question_data['choices']:
+                    question_data['choices'].append({
+                        'choice': 'Assessment not completed - no choices identified',
+                        'status': '⚠️ Not Selected'
+                    })
+                    question_data['stats'] = {'selected': 0, 'not_selected': 1, 'na': 0}
+
+                # Add to pillar
+                if current_pillar:
+                    pillars[current_pillar].append(question_data)
 
-                    i += 1
 
         return pillars
 
     def get_workload_data(self):
         """Return standardized workload data structure"""
 
-        workload_props = self.extract_workload_properties()
-        pillars_data = self.extract_improvement_plan_with_smart_urls()
+        try:
+            workload_props = self.extract_workload_properties()
+            pillars_data = self.extract_improvement_plan_with_smart_urls()
+        finally:
+            self.close()
 
         return {
             'workload_properties': workload_props,
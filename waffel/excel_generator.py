@@ -1,91 +1,263 @@
 #!/usr/bin/env python3
 """Excel report generator for WAFFEL assessments."""
 
+import os
+from collections import namedtuple
 from openpyxl import Workbook
-from openpyxl.styles import Alignment
+from openpyxl.cell import WriteOnlyCell
+from ._common import flatten_improvement_items
 from .config import WAFFELConfig
 
-class ExcelGenerator:
-    """Generates Excel files from Well-Architected data"""
+# xlsxwriter writes faster than openpyxl; it is used when installed
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# A styled cell; url turns the cell into a hyperlink
+Cell = namedtuple('Cell', ['value', 'font', 'fill', 'alignment', 'url'], defaults=(None, None, None, None))
+
+# Choice statistics shown on each question row: selected, not selected, not applicable
+_CHOICE_STATS_FMT = "✅ {} | ⚠️ {} | ❌ {}".format
+
+class _OpenpyxlSheet:
+    """Appends rows to an openpyxl write-only worksheet"""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.row = 1
+
+    def _cell(self, cell, column):
+        """Convert a Cell to a pre-styled openpyxl cell"""
+        if not isinstance(cell, Cell):
+            return cell
+
+        ws_cell = WriteOnlyCell(self.ws, value=cell.value)
+        if cell.font:
+            ws_cell.font = cell.font
+        if cell.fill:
+            ws_cell.fill = cell.fill
+        if cell.alignment:
+            ws_cell.alignment = cell.alignment
+        if cell.url:
+            ws_cell.row, ws_cell.column = self.row, column  # Hyperlink ref is taken from the coordinate
+            ws_cell.hyperlink = cell.url
+            ws_cell.style = "Hyperlink"
+        return ws_cell
+
+    def append(self, cells, height=None, outline=False):
+        """Append a row; outline rows are grouped and collapsed under the row above"""
+        if height or outline:
+            dims = self.ws.row_dimensions[self.row]
+            if height:
+                dims.height = height
+            if outline:
+                dims.outline_level = 1
+                dims.hidden = True
+
+        self.ws.append([self._cell(cell, column) for column, cell in enumerate(cells, 1)])
+        self.row += 1
+
+class _OpenpyxlBackend:
+    """Streams sheets to an openpyxl write-only workbook"""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.wb = Workbook(write_only=True)
+
+    def add_sheet(self, name, widths):
+        """Create a sheet with the given column widths by letter"""
+        ws = self.wb.create_sheet(name)
+        for column, width in widths.items():
+            ws.column_dimensions[column].width = width
+        return _OpenpyxlSheet(ws)
+
+    def save(self):
+        """Write the workbook file"""
+        self.wb.save(self.output_path)
+
+class _XlsxWriterSheet:
+    """Appends rows to an xlsxwriter worksheet"""
+
+    def __init__(self, backend, ws):
+        self.backend = backend
+        self.ws = ws
+        self.row = 0
+
+    def append(self, cells, height=None, outline=False):
+        """Append a row; outline rows are grouped and collapsed under the row above"""
+        if height or outline:
+            self.ws.set_row(self.row, height, None, {'level': 1, 'hidden': True} if outline else None)
+
+        for column, cell in enumerate(cells):
+            if not isinstance(cell, Cell):
+                self.ws.write(self.row, column, cell)
+            elif cell.url:
+                self.ws.write_url(self.row, column, cell.url, string=cell.value)
+            else:
+                self.ws.write(self.row, column, cell.value, self.backend.cell_format(cell.font, cell.fill, cell.alignment))
+        self.row += 1
+
+class _XlsxWriterBackend:
+    """Streams sheets to an xlsxwriter workbook in constant memory mode"""
+
+    def __init__(self, output_path):
+        self.wb = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'strings_to_urls': False})
+        self._formats = {}
+
+    def cell_format(self, font, fill, alignment):
+        """Return the xlsxwriter format for a combination of config styles, creating it once"""
+        if not (font or fill or alignment):
+            return None
+
+        key = (font, fill, alignment)
+        if key not in self._formats:
+            properties = {}
+            if font:
+                if font.b:
+                    properties['bold'] = True
+                if font.color is not None and font.color.rgb:
+                    properties['font_color'] = f"#{font.color.rgb[-6:]}"
+            if fill:
+                properties['pattern'] = 1
+                properties['bg_color'] = f"#{fill.fgColor.rgb[-6:]}"
+            if alignment:
+                if alignment.horizontal:
+                    properties['align'] = alignment.horizontal
+                if alignment.vertical:
+                    properties['valign'] = 'vcenter' if alignment.vertical == 'center' else alignment.vertical
+                if alignment.wrap_text:
+                    properties['text_wrap'] = True
+            self._formats[key] = self.wb.add_format(properties)
+        return self._formats[key]
+
+    def add_sheet(self, name, widths):
+        """Create a sheet with the given column widths by letter"""
+        ws = self.wb.add_worksheet(name)
+        for column, width in widths.items():
+            ws.set_column(f"{column}:{column}", width)
+        return _XlsxWriterSheet(self, ws)
+
+    def save(self):
+        """Write the workbook file"""
+        self.wb.close()
+
+class ExcelGenerator:  # pylint: disable=too-many-instance-attributes
+    """Generates Excel files from Well-Architected data
+
+    Sheets are streamed row by row from pre-styled cells through a backend:
+    xlsxwriter when it is installed, otherwise an openpyxl write-only workbook.
+    """
 
     def __init__(self):
         self.config = WAFFELConfig()
 
-    def generate(self, pillars, workload_props, output_path):
-        """Generate Excel file from standardized data"""
-
-        wb = Workbook()
-        wb.remove(wb.active)  # Remove default sheet
+        # Styles used per cell, resolved once
+        c = self.config
+        self._header_font = c.HEADER_FONT
+        self._header_fill = c.HEADER_FILL
+        self._question_font = c.QUESTION_FONT
+        self._question_fill = c.QUESTION_FILL
+        self._center = c.CENTER_ALIGNMENT
+        self._properties_alignment = c.PROPERTIES_ALIGNMENT
+        self._risk_colors = c.RISK_COLORS
+        self._status_colors = c.STATUS_COLORS
+
+        # Workload properties shown first, and a set to find the remaining ones
+        self._property_order = c.PROPERTY_ORDER
+        self._property_order_set = frozenset(c.PROPERTY_ORDER)
+
+    def generate(self, pillars, workload_props, output_path, improvement_items=None):
+        """Generate Excel file from standardized data; improvement_items may be pre-flattened"""
+        if improvement_items is None:
+            improvement_items = flatten_improvement_items(pillars)
+
+        # Write next to the target and swap it in, so a failed save never leaves a broken report
+        tmp_path = f"{output_path}.tmp"
+        backend = _XlsxWriterBackend(tmp_path) if xlsxwriter is not None else _OpenpyxlBackend(tmp_path)
+
+        try:
+            self._create_workload_properties_sheet(backend, workload_props)
+            self._create_summary_sheet(backend, pillars)
+            self._create_improvement_plan_sheet(backend, improvement_items)
+            self._create_pillar_sheets(backend, pillars)
+
+            backend.save()
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _header_row(self, headers, alignment=None):
+        """Create formatted header cells"""
+        header_font, header_fill, alignment = self._header_font, self._header_fill, alignment or self._center
+        return [Cell(header, header_font, header_fill, alignment) for header in headers]
+
+    def _create_workload_properties_sheet(self, backend, workload_props):
+        """Create workload properties sheet"""
+        ws = backend.add_sheet(self.config.SHEET_NAMES['properties'], self.config.COLUMN_WIDTHS['workload_props'])
 
-        self._create_workload_properties_sheet(wb, workload_props)
-        self._create_summary_sheet(wb, pillars)
-        self._create_improvement_plan_sheet(wb, pillars)
-        self._create_pillar_sheets(wb, pillars)
+        # Add properties in order, then the remaining ones
+        rows = []
+        for prop in self._property_order:
+            value = workload_props.get(prop)
+            if value is not None:
+                rows.append([prop, value])
+        rows.extend([prop, value] for prop, value in workload_props.items() if prop not in self._property_order_set)
 
-        wb.save(output_path)
+        # Headers and properties share row height and alignment
+        alignment = self._properties_alignment
+        ws.append(self._header_row(self.config.HEADERS['properties'], alignment), height=15)
 
-    def _create_workload_properties_sheet(self, wb, workload_props):
-        """Create workload properties sheet"""
-        ws = wb.create_sheet(self.config.SHEET_NAMES['properties'])
+        for row in rows:
+            ws.append([Cell(value, alignment=alignment) for value in row], height=15)
 
-        # Headers
-        ws.append(self.config.HEADERS['properties'])
-
-        # Format headers
-        for cell in ws[1]:
-            cell.font = self.config.HEADER_FONT
-            cell.fill = self.config.HEADER_FILL
-            cell.alignment = self.config.CENTER_ALIGNMENT
-
-        # Add properties in order
-        for prop in self.config.PROPERTY_ORDER:
-            if prop in workload_props:
-                ws.append([prop, workload_props[prop]])
-
-        # Add remaining properties
-        for prop, value in workload_props.items():
-            if prop not in self.config.PROPERTY_ORDER:
-                ws.append([prop, value])
-
-        # Set column widths and formatting
-        ws.column_dimensions['A'].width = self.config.COLUMN_WIDTHS['workload_props']['A']
-        ws.column_dimensions['B'].width = self.config.COLUMN_WIDTHS['workload_props']['B']
-
-        # Set row height and alignment
-        for row in ws.iter_rows():
-            ws.row_dimensions[row[0].row].height = 15
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=False, vertical="center")
-
-    def _create_summary_sheet(self, wb, pillars):
+    def _create_summary_sheet(self, backend, pillars):
         """Create summary sheet"""
-        ws = wb.create_sheet(self.config.SHEET_NAMES['summary'])
+        widths = {'A': self.config.COLUMN_WIDTHS['summary']['A']}
+        for col in ['B', 'C', 'D', 'E', 'F', 'G', 'H', 'I']:
+            widths[col] = self.config.COLUMN_WIDTHS['summary']['others']
+        ws = backend.add_sheet(self.config.SHEET_NAMES['summary'], widths)
 
         # Headers
-        ws.append(self.config.HEADERS['summary'])
-
-        # Format headers
-        for cell in ws[1]:
-            cell.font = self.config.HEADER_FONT
-            cell.fill = self.config.HEADER_FILL
-            cell.alignment = self.config.CENTER_ALIGNMENT
+        ws.append(self._header_row(self.config.HEADERS['summary']))
+        center = self._center
 
         # Add summary data
         for pillar_name, questions in pillars.items():
             if questions:
                 total_questions = len(questions)
-                answered_questions = len([q for q in questions if q['stats']['selected'] > 0])
-
-                high_risk = len([q for q in questions if q['risk_level'] == 'High Risk'])
-                medium_risk = len([q for q in questions if q['risk_level'] == 'Medium Risk'])
-                low_risk = len([q for q in questions if q['risk_level'] == 'Low Risk'])
-                with_notes = len([q for q in questions if q['notes']])
-
-                total_selected = sum(q['stats']['selected'] for q in questions)
-                total_not_selected = sum(q['stats']['not_selected'] for q in questions)
-                total_na = sum(q['stats']['na'] for q in questions)
-
-                ws.append([
+                answered_questions = high_risk = medium_risk = low_risk = with_notes = 0
+                total_selected = total_not_selected = total_na = 0
+
+                # Count everything in a single walk over the questions
+                for q in questions:
+                    q_stats = q['stats']
+                    risk = q['risk_level']
+
+                    if q_stats['selected'] > 0:
+                        answered_questions += 1
+                    if risk == 'High Risk':
+                        high_risk += 1
+                    elif risk == 'Medium Risk':
+                        medium_risk += 1
+                    elif risk == 'Low Risk':
+                        low_risk += 1
+                    if q['notes']:
+                        with_notes += 1
+
+                    total_selected += q_stats['selected']
+                    total_not_selected += q_stats['not_selected']
+                    total_na += q_stats['na']
+
+                # Apply risk colors
+                fills = [None] * 9
+                if high_risk > 0:
+                    fills[2] = self.config.HIGH_RISK_FILL
+                if medium_risk > 0:
+                    fills[3] = self.config.MEDIUM_RISK_FILL
+
+                ws.append([Cell(value, fill=fill, alignment=center) for value, fill in zip([
                     pillar_name,
                     f"{answered_questions}/{total_questions}",
                     high_risk,
@@ -95,164 +267,78 @@ class ExcelGenerator:
                     total_selected,
                     total_not_selected,
                     total_na
-                ])
-
-        # Format data and apply risk colors
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = self.config.CENTER_ALIGNMENT
+                ], fills)])
 
-            if len(row) >= 5:
-                high_risk_cell = row[2]
-                medium_risk_cell = row[3]
-
-                if high_risk_cell.value and high_risk_cell.value > 0:
-                    high_risk_cell.fill = self.config.HIGH_RISK_FILL
-                if medium_risk_cell.value and medium_risk_cell.value > 0:
-                    medium_risk_cell.fill = self.config.MEDIUM_RISK_FILL
-
-        # Set column widths
-        ws.column_dimensions['A'].width = self.config.COLUMN_WIDTHS['summary']['A']
-        for col in ['B', 'C', 'D', 'E', 'F', 'G', 'H', 'I']:
-            ws.column_dimensions[col].width = self.config.COLUMN_WIDTHS['summary']['others']
-
-    def _create_improvement_plan_sheet(self, wb, pillars):
+    def _create_improvement_plan_sheet(self, backend, improvement_items):
         """Create improvement plan sheet"""
-        ws = wb.create_sheet(self.config.SHEET_NAMES['improvement'])
+        ws = backend.add_sheet(self.config.SHEET_NAMES['improvement'], self.config.COLUMN_WIDTHS['improvement'])
 
         # Headers
-        ws.append(self.config.HEADERS['improvement'])
+        ws.append(self._header_row(self.config.HEADERS['improvement']))
+
+        if not improvement_items:
+            ws.append(["No improvement items found in this assessment."])
+            return
 
-        # Format headers
-        for cell in ws[1]:
-            cell.font = self.config.HEADER_FONT
-            cell.fill = self.config.HEADER_FILL
-            cell.alignment = self.config.CENTER_ALIGNMENT
+        risk_colors = self._risk_colors
 
         # Add improvement plan data
-        for questions in pillars.values():
-            for question in questions:
-                if question.get('improvement_items'):
-                    for item_data in question['improvement_items']:
-                        ws.append([
-                            question['pillar'],
-                            question['question_id'],
-                            question['question'],
-                            question['risk_level'],
-                            item_data['item'],
-                            item_data['url']
-                        ])
-
-                        # Color code risk level
-                        current_row = ws.max_row
-                        risk_cell = ws.cell(row=current_row, column=4)
-                        if question['risk_level'] in self.config.RISK_COLORS:
-                            risk_cell.fill = self.config.RISK_COLORS[question['risk_level']]
-
-                        # Make URL clickable
-                        if item_data['url']:
-                            url_cell = ws.cell(row=current_row, column=6)
-                            url_cell.hyperlink = item_data['url']
-                            url_cell.style = "Hyperlink"
-
-        # Set column widths
-        widths = self.config.COLUMN_WIDTHS['improvement']
-        ws.column_dimensions['A'].width = widths['A']
-        ws.column_dimensions['B'].width = widths['B']
-        ws.column_dimensions['C'].width = widths['C']
-        ws.column_dimensions['D'].width = widths['D']
-        ws.column_dimensions['E'].width = widths['E']
-        ws.column_dimensions['F'].width = widths['F']
-
-    def _create_pillar_sheets(self, wb, pillars):
+        for item_data in improvement_items:
+            ws.append([
+                item_data['pillar'],
+                item_data['question_id'],
+                item_data['question'],
+                # Color code risk level
+                Cell(item_data['risk_level'], fill=risk_colors.get(item_data['risk_level'])),
+                item_data['item'],
+                # Make URL clickable
+                Cell(item_data['url'], url=item_data['url'])
+            ])
+
+    def _create_pillar_sheets(self, backend, pillars):
         """Create individual pillar sheets"""
+
+        # Styles shared by every question and choice row
+        question_font = self._question_font
+        question_fill = self._question_fill
+        center = self._center
+        risk_colors = self._risk_colors
+        status_colors = self._status_colors
+
         for pillar_name, questions in pillars.items():
             if questions:
-                ws = wb.create_sheet(pillar_name)
+                ws = backend.add_sheet(pillar_name, self.config.COLUMN_WIDTHS['pillar'])
 
                 # Headers
-                ws.append(self.config.HEADERS['pillar'])
-
-                # Format headers
-                for cell in ws[1]:
-                    cell.font = self.config.HEADER_FONT
-                    cell.fill = self.config.HEADER_FILL
-                    cell.alignment = self.config.CENTER_ALIGNMENT
-
-                current_row = 2
+                ws.append(self._header_row(self.config.HEADERS['pillar']), height=15)
 
                 for question in questions:
                     # Calculate choice statistics
-                    selected_count = question['stats']['selected']
-                    not_selected_count = question['stats']['not_selected']
-                    na_count = question['stats']['na']
-                    choice_stats = f"✅ {selected_count} | ⚠️ {not_selected_count} | ❌ {na_count}"
-
-                    # Main question row
-                    ws.append([
-                        question['question_id'],
-                        question['question'],
-                        choice_stats,
-                        question['risk_level'],
-                        question['notes'],
-                        question.get('improvement_plan', '')
-                    ])
-
-                    # Format question row
-                    for col in range(1, 7):
-                        cell = ws.cell(row=current_row, column=col)
-                        cell.font = self.config.QUESTION_FONT
-                        cell.fill = self.config.QUESTION_FILL
-
-                        if col == 3:  # Center choice/details column
-                            cell.alignment = self.config.CENTER_ALIGNMENT
+                    q_stats = question['stats']
+                    choice_stats = _CHOICE_STATS_FMT(q_stats['selected'], q_stats['not_selected'], q_stats['na'])
 
                     # Color code risk level
-                    if question['risk_level']:
-                        risk_cell = ws.cell(row=current_row, column=4)
-                        if question['risk_level'] in self.config.RISK_COLORS:
-                            risk_cell.fill = self.config.RISK_COLORS[question['risk_level']]
+                    risk_fill = risk_colors.get(question['risk_level'], question_fill)
 
-                    current_row += 1
-                    group_start = current_row
-
-                    # Add choices as sub-rows
+                    # Main question row, styled as its cells are built
+                    ws.append([
+                        Cell(question['question_id'], question_font, question_fill),
+                        Cell(question['question'], question_font, question_fill),
+                        Cell(choice_stats, question_font, question_fill, center),  # Center choice/details column
+                        Cell(question['risk_level'], question_font, risk_fill),
+                        Cell(question['notes'], question_font, question_fill),
+                        Cell(question.get('improvement_plan', ''), question_font, question_fill)
+                    ], height=15)
+
+                    # Add choices as sub-rows, grouped under the question
                     for choice in question['choices']:
+                        status_cell = Cell(choice['status'], fill=status_colors.get(choice['status']), alignment=center)
+
                         ws.append([
                             '',
                             f"   • {choice['choice']}",
-                            choice['status'],
+                            status_cell,
                             '',
                             choice.get('description', ''),
                             ''
-                        ])
-
-                        # Format choice row
-                        status_cell = ws.cell(row=current_row, column=3)
-                        status_cell.alignment = self.config.CENTER_ALIGNMENT
-
-                        if choice['status'] in self.config.STATUS_COLORS:
-                            status_cell.fill = self.config.STATUS_COLORS[choice['status']]
-
-                        current_row += 1
-
-                    # Group choices under question
-                    if len(question['choices']) > 0:
-                        group_end = current_row - 1
-                        try:
-                            ws.row_dimensions.group(group_start, group_end, outline_level=1, hidden=True)
-                        except:  # pylint: disable=bare-except  # nosec B110
-                            pass
-
-                # Set column widths
-                widths = self.config.COLUMN_WIDTHS['pillar']
-                ws.column_dimensions['A'].width = widths['A']
-                ws.column_dimensions['B'].width = widths['B']
-                ws.column_dimensions['C'].width = widths['C']
-                ws.column_dimensions['D'].width = widths['D']
-                ws.column_dimensions['E'].width = widths['E']
-                ws.column_dimensions['F'].width = widths['F']
-
-                # Set row heights
-                for row in ws.iter_rows():
-                    ws.row_dimensions[row[0].row].height = 15
+                        ], height=15, outline=True)
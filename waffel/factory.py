@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 """Factory for creating data sources."""
 
-from .data_source_pdf import PDFDataSource
-from .data_source_api import APIDataSource
+from functools import lru_cache
+from importlib import import_module
 
-def create_data_source(pdf_path=None, workload_id=None, lens_alias=None):
+# Data source classes by kind, imported on first use so the PDF path never loads boto3
+DATA_SOURCE_CLASSES = {
+    'pdf': ('.data_source_pdf', 'PDFDataSource'),
+    'api': ('.data_source_api', 'APIDataSource')
+}
+
+@lru_cache(maxsize=len(DATA_SOURCE_CLASSES))
+def _get_data_source_class(kind):
+    """Import and return the data source class for a kind"""
+    module_name, class_name = DATA_SOURCE_CLASSES[kind]
+    return getattr(import_module(module_name, __package__), class_name)
+
+def create_data_source(pdf_path=None, workload_id=None, lens_alias=None, fetch_details=True):
     """Factory function to create appropriate data source"""
     if pdf_path:
-        return PDFDataSource(pdf_path)
-    return APIDataSource(workload_id, lens_alias)
+        return _get_data_source_class('pdf')(pdf_path)
+    return _get_data_source_class('api')(workload_id, lens_alias, fetch_details)
@@ -1,22 +1,109 @@
 #!/usr/bin/env python3
 """PowerPoint presentation generator for WAFFEL reports."""
 
+import html
 import io
+import os
+import re
+import time
+from functools import lru_cache
 import requests
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from ._common import cache_path, flatten_improvement_items, truncate
 from .config import WAFFELConfig
 
+EISENHOWER_URL = "https://docs.aws.amazon.com/images/wellarchitected/latest/userguide/images/eisenhower.png"
+
+# The downloaded image is reused from the disk cache for a week
+EISENHOWER_MAX_AGE = 7 * 24 * 60 * 60
+
+# Improvement item card: pillar-colored rectangle with a bold (linked) question ID
+# followed by the item text, matching what add_shape and the text frame API produce
+_ITEM_RECT_XML = (
+    '<p:sp %s>'
+    '<p:nvSpPr><p:cNvPr id="{id}" name="{name}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>'
+    '<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+    '<a:ln w="{line_width}"><a:solidFill><a:srgbClr val="{line}"/></a:solidFill></a:ln>'
+    '</p:spPr>'
+    '<p:style>'
+    '<a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef>'
+    '</p:style>'
+    '<p:txBody>'
+    '<a:bodyPr rtlCol="0" anchor="ctr" lIns="{inset}" rIns="{inset}" tIns="{inset}" bIns="{inset}" wrap="square"/>'
+    '<a:lstStyle/>'
+    '<a:p><a:pPr algn="ctr"/>'
+    '<a:r><a:rPr b="1" sz="{size}"><a:solidFill><a:srgbClr val="{text_color}"/></a:solidFill>{hlink}</a:rPr>'
+    '<a:t>{question_id} </a:t></a:r>'
+    '<a:r><a:rPr sz="{size}"><a:solidFill><a:srgbClr val="{text_color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r>'
+    '</a:p>'
+    '</p:txBody>'
+    '</p:sp>'
+) % nsdecls('a', 'p', 'r')
+
+# Characters XML cannot hold; python-pptx writes them as _xHHHH_ escapes
+_XML_CTRL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _xml_text(text):
+    """Escape text for the content of an XML element"""
+    return html.escape(_XML_CTRL_CHARS_RE.sub(lambda m: f"_x{ord(m.group()):04X}_", text), quote=False)
+
+@lru_cache(maxsize=1)
+def _fetch_eisenhower_bytes():
+    """Return the Eisenhower matrix image, downloading it only when the cached copy is stale"""
+    path = cache_path('eisenhower.png')
+    try:
+        if time.time() - os.path.getmtime(path) < EISENHOWER_MAX_AGE:
+            with open(path, 'rb') as image_file:
+                return image_file.read()
+    except OSError:
+        pass
+
+    try:
+        response = requests.get(EISENHOWER_URL, timeout=10)  # nosec B113
+        response.raise_for_status()
+    except requests.RequestException:
+        # A stale copy is still better than the text fallback
+        with open(path, 'rb') as image_file:
+            return image_file.read()
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as image_file:
+            image_file.write(response.content)
+    except OSError:
+        pass
+
+    return response.content
+
 class PowerPointGenerator:
     """Generates PowerPoint presentations from Well-Architected data"""
 
+    # Card colors shared by every improvement item
+    BORDER_RGB = RGBColor(100, 100, 100)  # Gray border for all
+    TEXT_RGB = RGBColor(0, 0, 0)
+    DEFAULT_PILLAR_RGB = RGBColor(200, 200, 200)
+
     def __init__(self):
         self.config = WAFFELConfig()
+        self._pillar_rgb = {name: RGBColor(*rgb) for name, rgb in self.config.PILLAR_COLORS.items()}
 
-    def generate(self, pillars, workload_props, output_path):
-        """Generate PowerPoint file with improvement items as colored rectangles"""
+    def generate(self, pillars, workload_props, output_path, improvement_items=None):
+        """Generate PowerPoint file with improvement items (flattened if not given) as colored rectangles"""
+        if improvement_items is None:
+            improvement_items = flatten_improvement_items(pillars)
 
         prs = Presentation()
 
@@ -24,7 +111,7 @@ class PowerPointGenerator:
         self._create_title_slide(prs, workload_props)
 
         # Create improvement items slides
-        self._create_improvement_slides(prs, pillars)
+        self._create_improvement_slides(prs, improvement_items)
 
         # Add Eisenhower matrix slide
         self._create_eisenhower_slide(prs)
@@ -46,23 +133,9 @@ class PowerPointGenerator:
         title.text = f"{workload_name}"
         subtitle.text = "Improvement Plan Overview"
 
-    def _create_improvement_slides(self, prs, pillars):
+    def _create_improvement_slides(self, prs, improvement_items):
         """Create single slide with all improvement items as small colored rectangles"""
 
-        # Collect all improvement items
-        improvement_items = []
-        for pillar_name, questions in pillars.items():
-            for question in questions:
-                if question.get('improvement_items'):
-                    for item_data in question['improvement_items']:
-                        improvement_items.append({
-                            'pillar': pillar_name,
-                            'item': item_data['item'],
-                            'url': item_data['url'],
-                            'question_id': question['question_id'],
-                            'risk_level': question.get('risk_level', '')
-                        })
-
         if not improvement_items:
             # Create slide with "No improvement items" message
             slide_layout = prs.slide_layouts[1]  # Title and content layout
@@ -103,6 +176,23 @@ class PowerPointGenerator:
         available_width = Inches(9)
         cols = int((available_width - start_x) / (rect_width + margin))
 
+        # Item rectangles are appended to the shape tree as XML built from a template,
+        # skipping python-pptx's per-shape factory and property setters
+        sp_tree = slide.shapes.element
+        next_id = max((int(shape_id) for shape_id in sp_tree.xpath('//@id') if shape_id.isdigit()), default=0) + 1
+        elements = []
+
+        # Card attributes that are the same for every item
+        card_style = {
+            'cx': rect_width,
+            'cy': rect_height,
+            'line': self.BORDER_RGB,
+            'line_width': Inches(0.01),  # Thin border
+            'inset': Inches(0.02),
+            'size': Pt(8).centipoints,  # 8pt font
+            'text_color': self.TEXT_RGB
+        }
+
         for idx, item in enumerate(items):
             row = idx // cols
             col = idx % cols
@@ -110,60 +200,29 @@ class PowerPointGenerator:
             x = start_x + col * (rect_width + margin)
             y = start_y + row * (rect_height + margin)
 
-            # Create rectangle
-            rect = slide.shapes.add_shape(
-                1,  # Rectangle shape type
-                x, y, rect_width, rect_height
-            )
-
-            # Set pillar color (pastel)
-            pillar_color = self.config.PILLAR_COLORS.get(item['pillar'], (200, 200, 200))
-            rect.fill.solid()
-            rect.fill.fore_color.rgb = RGBColor(*pillar_color)
-
-            # Add border - same color for all (no special high risk border)
-            rect.line.color.rgb = RGBColor(100, 100, 100)  # Gray border for all
-            rect.line.width = Inches(0.01)  # Thin border
-
-            # Add text with question ID prefix
-            text_frame = rect.text_frame
-            text_frame.margin_left = Inches(0.02)
-            text_frame.margin_right = Inches(0.02)
-            text_frame.margin_top = Inches(0.02)
-            text_frame.margin_bottom = Inches(0.02)
-            text_frame.word_wrap = True
-
-            # Question ID (bold) + improvement text in same string
-            p = text_frame.paragraphs[0]
-            item_text = item['item']
-            # Calculate space for question ID + space + text
+            # Question ID + space + text
             question_id = item['question_id']
-            available_chars = 50 - len(question_id) - 1  # Reserve space for ID + space
-            if len(item_text) > available_chars:
-                item_text = item_text[:available_chars-3] + "..."
-
-            # Create text with question ID and improvement text
-            p = text_frame.paragraphs[0]
-            p.clear()
+            item_text = truncate(item['item'], 50 - len(question_id) - 1)  # Reserve space for ID + space
 
-            # Add question ID as bold hyperlink
-            question_run = p.add_run()
-            question_run.text = question_id + " "
-            question_run.font.bold = True
-            question_run.font.size = Pt(8)  # 8pt font
-
-            # Add hyperlink to question ID if URL exists
+            # Link the question ID if URL exists
+            hlink = ''
             if item['url']:
-                question_run.hyperlink.address = item['url']
-
-            # Force text color to black (must be after hyperlink creation)
-            question_run.font.color.rgb = RGBColor(0, 0, 0)
-
-            # Add improvement text as normal
-            text_run = p.add_run()
-            text_run.text = item_text
-            text_run.font.size = Pt(8)  # 8pt font
-            text_run.font.color.rgb = RGBColor(0, 0, 0)
+                r_id = slide.part.relate_to(item['url'], RT.HYPERLINK, is_external=True)
+                hlink = f'<a:hlinkClick r:id="{r_id}"/>'
+
+            shape_id = next_id + idx
+            elements.append(parse_xml(_ITEM_RECT_XML.format(
+                id=shape_id,
+                name=f"Rectangle {shape_id - 1}",
+                x=x, y=y,
+                fill=self._pillar_rgb.get(item['pillar'], self.DEFAULT_PILLAR_RGB),  # Pillar color (pastel)
+                hlink=hlink,
+                question_id=_xml_text(question_id),
+                text=_xml_text(item_text),
+                **card_style
+            )))
+
+        sp_tree.extend(elements)
 
     def _create_eisenhower_slide(self, prs):
         """Create slide with full-height Eisenhower matrix image"""
@@ -178,14 +237,10 @@ class PowerPointGenerator:
         title_frame.paragraphs[0].font.bold = True
         title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
 
-        # Download and add image (full height)
+        # Download (or reuse the cached) image and add it full height
         try:
-            image_url = "https://docs.aws.amazon.com/images/wellarchitected/latest/userguide/images/eisenhower.png"
-            response = requests.get(image_url, timeout=10)  # nosec B113
-            response.raise_for_status()
-
             # Add image to slide - full height (6.5 inches available after title)
-            image_stream = io.BytesIO(response.content)
+            image_stream = io.BytesIO(_fetch_eisenhower_bytes())
             slide.shapes.add_picture(image_stream, Inches(0.5), Inches(0.9), height=Inches(6.5))
 
         except Exception: